@@ -24,16 +24,43 @@ Minimum expected tables (existing from your working setup):
 Optional tables (tools will error at runtime if missing, but MCP will still connect):
 - person_event(person_id, event_id, role)
 - research_note(id, person_id, note, source_url, created_at)
+
+Search/list tools project just these columns (plus status in the review
+queues); get_person, get_family_group and get_events_for_person return full rows.
+
+On first database use the server starts creating the search indexes it relies
+on (pg_trgm extension + _INDEXES) in the background, with CREATE INDEX
+CONCURRENTLY. Statements that fail (missing optional table, insufficient
+privileges) are logged and skipped.
 """
+import atexit
+import csv
+import functools
+import io
+import itertools
+import logging
 import os
+import re
+import threading
+import time
 import uuid
-from typing import Any, Dict, Optional, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 
+import anyio
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.errorcodes
+from psycopg2.extensions import TRANSACTION_STATUS_UNKNOWN, connection as PgConnection, register_adapter
+from psycopg2.extras import RealDictCursor, UUID_adapter, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from mcp.server.fastmcp import FastMCP
 
+# Send uuid.UUID parameters as uuid literals. Only the adapter is registered
+# (not psycopg2.extras.register_uuid), so uuid columns still come back as str.
+register_adapter(uuid.UUID, UUID_adapter)
+
 mcp = FastMCP("genealogy_db")
+log = logging.getLogger("genealogy_db")
 
 DATABASE_URL = os.getenv("DATABASE_URL", "").strip()
 
@@ -45,10 +72,304 @@ DB = {
     "password": os.getenv("DB_PASSWORD", os.getenv("PGPASSWORD", "genealogy")),
 }
 
-def db_conn():
-    if DATABASE_URL:
-        return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-    return psycopg2.connect(**DB, cursor_factory=RealDictCursor)
+_CONNECT_KWARGS: Dict[str, Any] = {
+    "dsn": DATABASE_URL or None,
+    "cursor_factory": RealDictCursor,
+    **({} if DATABASE_URL else DB),
+}
+
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))  # opened eagerly; see _Pool
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+
+# Lowercased "first middle last" searched by search_persons, single-spaced with
+# missing parts skipped. concat_ws would read better but is only STABLE, which
+# Postgres rejects in an index expression. The index and the query must agree
+# on this text exactly for the planner to use the expression index.
+_PERSON_FULL_NAME = (
+    "lower(ltrim(coalesce(first_name,'')"
+    "||coalesce(' '||nullif(middle_name,''),'')"
+    "||coalesce(' '||nullif(last_name,''),'')))"
+)
+
+# Indexes the tools rely on, created by _migrate: (name, definition).
+_INDEXES: List[Tuple[str, str]] = [
+    ("person_fullname_trgm", f"ON person USING gin ({_PERSON_FULL_NAME} gin_trgm_ops)"),
+    ("location_name_trgm", "ON location USING gin (name gin_trgm_ops)"),
+    ("research_note_tsv", "ON research_note USING gin (to_tsvector('english', note))"),
+    # wildcard searches in search_research_notes
+    ("research_note_note_trgm", "ON research_note USING gin (note gin_trgm_ops)"),
+    # B-tree range scans for prefix=True searches
+    ("person_last_name_pattern", "ON person (lower(last_name) text_pattern_ops)"),
+    ("person_first_name_pattern", "ON person (lower(first_name) text_pattern_ops)"),
+    ("location_name_pattern", "ON location (lower(name) text_pattern_ops)"),
+    # review queues (list_unreviewed_*): only the shrinking unreviewed set is
+    # indexed; the person index also covers list_unreviewed_persons' columns,
+    # allowing index-only scans
+    ("person_unreviewed", "ON person (id) INCLUDE (first_name, middle_name, last_name, status) WHERE status IS NULL OR status='unreviewed'"),
+    ("relationship_unreviewed", "ON relationship (id) WHERE status IS NULL OR status='unreviewed'"),
+    ("assertion_unreviewed", "ON assertion (id) WHERE status IS NULL OR status='unreviewed'"),
+]
+
+class _PooledConnection(PgConnection):
+    """
+    Connection that remembers which named statements it has PREPAREd.
+    Prepared statements live for the lifetime of the server session, so the
+    cache lives on the connection object: when the pool discards a broken
+    connection and opens a new one, the replacement starts with an empty cache.
+    """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prepared: set = set()
+
+class _Pool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that keeps up to maxconn idle connections.
+    The base class closes every returned connection beyond minconn, so
+    parallel tool calls would keep reconnecting (and re-PREPAREing on the new
+    connections). minconn still decides how many are opened up front.
+    """
+    def _putconn(self, conn: Any, key: Any = None, close: bool = False) -> None:
+        # called under self._lock by putconn()
+        minconn, self.minconn = self.minconn, self.maxconn
+        try:
+            super()._putconn(conn, key, close)
+        finally:
+            self.minconn = minconn
+
+    def discard_idle(self) -> None:
+        """Close every idle connection, e.g. after the server went away."""
+        with self._lock:
+            idle, self._pool = self._pool, []
+        for conn in idle:
+            conn.close()
+
+_pool: Optional[_Pool] = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises PoolError when exhausted; tool threads wait
+# on this instead so bursts beyond DB_POOL_MAX queue rather than fail.
+_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+
+def _get_pool() -> _Pool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+    Creation is deferred so the MCP server can start (and negotiate sessions)
+    before Postgres is reachable. The first creation also starts _migrate in
+    the background.
+    Connections opened by a burst stay idle in the pool afterwards (up to
+    DB_POOL_MAX), trading server-side backends for warm, already-PREPAREd
+    connections on the next burst.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _Pool(
+                    minconn=DB_POOL_MIN,
+                    maxconn=DB_POOL_MAX,
+                    connection_factory=_PooledConnection,
+                    **_CONNECT_KWARGS,
+                )
+                threading.Thread(target=_migrate, name="genealogy-migrate", daemon=True).start()
+    return _pool
+
+# pg_try_advisory_lock key serialising _migrate across processes
+_MIGRATE_LOCK = 0x67656E6561  # "genea"
+
+def _migrate() -> None:
+    """
+    Create pg_trgm and _INDEXES on a dedicated autocommit connection, outside
+    the pool, so tool calls never wait on index builds. Indexes are built
+    CONCURRENTLY so writers are not blocked; an INVALID index left by an
+    interrupted build is dropped and rebuilt (IF NOT EXISTS alone would keep
+    it forever). A build still in progress is INVALID too, so only the
+    process holding _MIGRATE_LOCK runs this; others (more workers, a
+    replacement container) skip it. Failures (missing optional table,
+    insufficient privileges) are logged and skipped.
+    """
+    try:
+        conn = psycopg2.connect(**_CONNECT_KWARGS)
+    except psycopg2.Error as e:
+        log.warning("migrations skipped: %s", str(e).strip())
+        return
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            # session-level: released when conn closes, even if we crash
+            try:
+                cur.execute("SELECT pg_try_advisory_lock(%s) AS locked", (_MIGRATE_LOCK,))
+                locked = cur.fetchone()["locked"]
+            except psycopg2.Error as e:
+                log.warning("migrations skipped: %s", str(e).strip())
+                return
+            if not locked:
+                log.info("migrations skipped: running in another process")
+                return
+            try:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            except psycopg2.Error as e:
+                log.warning("migration skipped: pg_trgm (%s)", str(e).strip())
+            for name, definition in _INDEXES:
+                try:
+                    cur.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (name,))
+                    row = cur.fetchone()
+                    if row and row["indisvalid"]:
+                        continue
+                    if row:
+                        log.warning("rebuilding invalid index %s", name)
+                        cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                    cur.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+                except psycopg2.Error as e:
+                    log.warning("migration skipped: %s (%s)", name, str(e).strip())
+    finally:
+        conn.close()
+
+def _close_pool() -> None:
+    if _pool is not None:
+        _pool.closeall()
+
+atexit.register(_close_pool)
+
+@contextmanager
+def _checkout() -> Iterator[Any]:
+    """
+    Borrow a pooled connection; it always goes back to the pool
+    (closed connections are discarded).
+    Idle connections are not pinged: after a Postgres restart the first call
+    to use one fails, and the rest of the idle set is then dropped so later
+    calls reconnect instead of failing one by one.
+    """
+    pool = _get_pool()
+    with _pool_slots:
+        conn = pool.getconn()
+        if conn.closed or conn.info.transaction_status == TRANSACTION_STATUS_UNKNOWN:
+            pool.putconn(conn, close=True)
+            conn = pool.getconn()
+        try:
+            yield conn
+        except psycopg2.OperationalError:
+            if conn.closed:
+                pool.discard_idle()
+            raise
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+
+@contextmanager
+def db_conn() -> Iterator[Any]:
+    """
+    Check a pooled connection out for one unit of work.
+    Commits on success, rolls back on error.
+    """
+    with _checkout() as conn:
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+
+@contextmanager
+def simple_write() -> Iterator[Any]:
+    """
+    Cursor on an autocommit connection, for tools whose writes are each a
+    single statement: saves the COMMIT round-trip db_conn() would add.
+    """
+    with _checkout() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                yield cur
+        finally:
+            if not conn.closed:
+                conn.autocommit = False
+
+# EXECUTE failures that mean the connection's prepared statement is unusable:
+# invalid_sql_statement_name (e.g. after DEALLOCATE/DISCARD ALL) and
+# feature_not_supported ("cached plan must not change result type").
+_STALE_PREPARED_CODES = frozenset({
+    psycopg2.errorcodes.INVALID_SQL_STATEMENT_NAME,
+    psycopg2.errorcodes.FEATURE_NOT_SUPPORTED,
+})
+
+# name -> "PREPARE name AS ..." text, built once per process
+_PREPARE_SQL: Dict[str, str] = {}
+
+def _to_positional(sql: str) -> str:
+    n = itertools.count(1)
+    return re.sub(r"%s", lambda _m: f"${next(n)}", sql)
+
+def exec_prepared(cur: Any, name: str, sql: str, args: tuple) -> None:
+    """
+    Execute `sql` (psycopg2 %s placeholders) as the server-side prepared
+    statement `name`, PREPAREing it on first use per connection.
+    Each name must always be used with the same SQL text.
+    """
+    conn = cur.connection
+    if name not in conn._prepared:
+        if name not in _PREPARE_SQL:
+            _PREPARE_SQL[name] = f"PREPARE {name} AS {_to_positional(sql)}"
+        cur.execute(_PREPARE_SQL[name])
+        conn._prepared.add(name)
+    placeholders = ",".join(["%s"] * len(args))
+    try:
+        cur.execute(f"EXECUTE {name}({placeholders})", args)
+    except psycopg2.Error as e:
+        if e.pgcode in _STALE_PREPARED_CODES:
+            # The server-side statement is gone or no longer matches the
+            # schema; this connection cannot recover it mid-transaction, so
+            # close it and let the pool open a fresh one (empty cache).
+            conn.close()
+        raise
+
+# Above every tool's default limit (max 200), so default calls always take the
+# prepared-statement path; only explicit large limits (up to 500) stream.
+STREAM_THRESHOLD = 250
+STREAM_BATCH = 100
+
+def fetch_rows(conn: Any, name: Optional[str], sql: str, args: tuple, limit: int) -> List[Dict[str, Any]]:
+    """
+    Run a read query ending in "LIMIT %s" and return its rows.
+    Up to STREAM_THRESHOLD rows go through exec_prepared as statement `name`,
+    or as plain SQL when `name` is None (use that for SELECT * / e.* queries:
+    a prepared statement's result columns cannot change after ALTER TABLE).
+    Larger limits read through a named server-side cursor in STREAM_BATCH-row
+    fetches. The rows are still collected into one list for the response, so
+    this only avoids the driver buffering the full result a second time; it
+    costs extra DECLARE/FETCH/CLOSE round-trips and skips the prepared plan
+    (DECLARE cannot wrap EXECUTE).
+    """
+    args = (*args, limit)
+    if limit <= STREAM_THRESHOLD:
+        with conn.cursor() as cur:
+            if name is None:
+                cur.execute(sql, args)
+            else:
+                exec_prepared(cur, name, sql, args)
+            return cur.fetchall()
+    rows: List[Dict[str, Any]] = []
+    # statement name + full uuid hex could pass Postgres' 63-byte identifier
+    # limit, adding a truncation NOTICE to every DECLARE/FETCH/CLOSE
+    with conn.cursor(name=f"c_{uuid.uuid4().hex[:16]}") as cur:
+        cur.itersize = STREAM_BATCH
+        cur.execute(sql, args)
+        for row in cur:
+            rows.append(row)
+    return rows
+
+def tool():
+    """
+    Register a blocking handler as an MCP tool that runs in a worker thread.
+    FastMCP calls sync tools directly on the event loop, so without this one
+    slow query stalls every other client's session.
+    The module-level name stays the plain sync function for internal reuse.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def run_in_thread(**kwargs: Any) -> Any:
+            return await anyio.to_thread.run_sync(functools.partial(fn, **kwargs))
+        mcp.tool()(run_in_thread)
+        return fn
+    return decorator
 
 def ok(data: Any) -> Dict[str, Any]:
     return {"status": "ok", "data": data}
@@ -57,64 +378,134 @@ def err(code: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     return {"status": "error", "error": code, "details": details or {}}
 
 def _uuid() -> str:
-    return str(uuid.uuid4())
+    """
+    Time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp followed by
+    random bits, so new primary keys append to the right of the B-tree
+    instead of landing on random index pages.
+    """
+    ms = time.time_ns() // 1_000_000
+    value = (ms & ((1 << 48) - 1)) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+# Plain or hyphenated hex, the forms Postgres' uuid input accepts. uuid.UUID()
+# is looser (urn:uuid: prefix, hyphens anywhere), and those raw strings would
+# still fail inside the database.
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}")
+
+def _is_uuid(value: str) -> bool:
+    return isinstance(value, str) and _UUID_RE.fullmatch(value) is not None
+
+BULK_PAGE_SIZE = 500
 
-def _parse_uuid_csv(uuid_csv: str) -> List[str]:
+def _parse_uuid_csv(uuid_csv: str) -> List[uuid.UUID]:
     """
     Parse a comma-separated list of UUID strings.
-    Returns only non-empty trimmed tokens.
+    Empty tokens are skipped; raises ValueError(token) on the first malformed one.
     """
     if not uuid_csv:
         return []
-    parts = [p.strip() for p in uuid_csv.split(",")]
-    return [p for p in parts if p]
+    ids: List[uuid.UUID] = []
+    for p in uuid_csv.split(","):
+        p = p.strip()
+        if not p:
+            continue
+        try:
+            ids.append(uuid.UUID(p))
+        except ValueError:
+            raise ValueError(p) from None
+    return ids
+
+def _parse_links_csv(links_csv: str) -> List[tuple]:
+    """
+    Parse "person_id,event_id[,role];..." into (person_id, event_id, role)
+    tuples, one per distinct pair (the last role given for a pair wins).
+    Raises ValueError(entry) on the first malformed entry.
+    """
+    links: Dict[tuple, str] = {}
+    for entry in (links_csv or "").split(";"):
+        if not entry.strip():
+            continue
+        parts = [p.strip() for p in entry.split(",", 2)]
+        if len(parts) < 2 or not _is_uuid(parts[0]) or not _is_uuid(parts[1]):
+            raise ValueError(entry.strip())
+        role = parts[2] if len(parts) == 3 and parts[2] else "subject"
+        links[(str(uuid.UUID(parts[0])), str(uuid.UUID(parts[1])))] = role
+    return [(pid, eid, role) for (pid, eid), role in links.items()]
 
 # -------------------------
 # PERSON
 # -------------------------
 
-@mcp.tool()
+@tool()
 def create_person(first_name: str = "", middle_name: str = "", last_name: str = ""):
     if not first_name and not last_name:
         return err("missing_name")
     pid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute(
             "INSERT INTO person (id, first_name, middle_name, last_name) VALUES (%s,%s,%s,%s)",
             (pid, first_name or None, middle_name or None, last_name or None),
         )
     return ok({"person_id": pid})
 
-@mcp.tool()
+@tool()
 def get_person(person_id: str):
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
     with db_conn() as conn, conn.cursor() as cur:
         cur.execute("SELECT * FROM person WHERE id=%s", (person_id,))
         row = cur.fetchone()
     return ok(row) if row else err("not_found")
 
-@mcp.tool()
-def search_persons(query: str, limit: int = 20):
-    like = f"%{query}%"
+@tool()
+def search_persons(query: str, limit: int = 20, prefix: bool = False):
+    """
+    Search persons by name (case-insensitive).
+    By default matches `query` anywhere in the single-spaced full name
+    "first middle last" (so "john smith" finds John Smith); with prefix=True
+    only first or last names starting with `query` match (faster on large tables).
+    """
     limit = max(1, min(int(limit), 200))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT *
-            FROM person
-            WHERE coalesce(first_name,'') ILIKE %s
-               OR coalesce(middle_name,'') ILIKE %s
-               OR coalesce(last_name,'') ILIKE %s
-            ORDER BY last_name NULLS LAST, first_name NULLS LAST
-            LIMIT %s
-            """,
-            (like, like, like, limit),
-        )
-        rows = cur.fetchall()
+    with db_conn() as conn:
+        if prefix:
+            like = f"{query.lower()}%"
+            rows = fetch_rows(
+                conn,
+                "ps_search_persons_prefix",
+                """
+                SELECT id, first_name, middle_name, last_name
+                FROM person
+                WHERE lower(last_name) LIKE %s
+                   OR lower(first_name) LIKE %s
+                ORDER BY last_name NULLS LAST, first_name NULLS LAST
+                LIMIT %s
+                """,
+                (like, like),
+                limit,
+            )
+        else:
+            rows = fetch_rows(
+                conn,
+                "ps_search_persons",
+                f"""
+                SELECT id, first_name, middle_name, last_name
+                FROM person
+                WHERE {_PERSON_FULL_NAME} LIKE %s
+                ORDER BY last_name NULLS LAST, first_name NULLS LAST
+                LIMIT %s
+                """,
+                (f"%{query.lower()}%",),
+                limit,
+            )
     return ok({"count": len(rows), "persons": rows})
 
-@mcp.tool()
+@tool()
 def update_person(person_id: str, first_name: str = "", middle_name: str = "", last_name: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with simple_write() as cur:
         cur.execute(
             """
             UPDATE person
@@ -122,10 +513,11 @@ def update_person(person_id: str, first_name: str = "", middle_name: str = "", l
                 middle_name = COALESCE(NULLIF(%s,''), middle_name),
                 last_name  = COALESCE(NULLIF(%s,''), last_name)
             WHERE id=%s
+            RETURNING id
             """,
             (first_name, middle_name, last_name, person_id),
         )
-        if cur.rowcount == 0:
+        if cur.fetchone() is None:
             return err("not_found")
     return ok({"person_id": person_id})
 
@@ -133,43 +525,71 @@ def update_person(person_id: str, first_name: str = "", middle_name: str = "", l
 # LOCATION
 # -------------------------
 
-@mcp.tool()
+@tool()
 def create_location(name: str):
     if not name:
         return err("missing_name")
     lid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute("INSERT INTO location (id, name) VALUES (%s,%s)", (lid, name))
     return ok({"location_id": lid})
 
-@mcp.tool()
-def search_locations(query: str, limit: int = 20):
-    like = f"%{query}%"
+@tool()
+def search_locations(query: str, limit: int = 20, prefix: bool = False):
+    """
+    Search locations by name (case-insensitive).
+    With prefix=True only names starting with `query` match.
+    """
     limit = max(1, min(int(limit), 200))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            "SELECT * FROM location WHERE name ILIKE %s ORDER BY name LIMIT %s",
-            (like, limit),
-        )
-        rows = cur.fetchall()
+    with db_conn() as conn:
+        if prefix:
+            rows = fetch_rows(
+                conn,
+                "ps_search_locations_prefix",
+                """
+                SELECT id, name
+                FROM location
+                WHERE lower(name) LIKE %s
+                ORDER BY name
+                LIMIT %s
+                """,
+                (f"{query.lower()}%",),
+                limit,
+            )
+        else:
+            rows = fetch_rows(
+                conn,
+                "ps_search_locations",
+                """
+                SELECT id, name
+                FROM location
+                WHERE name ILIKE %s
+                ORDER BY name
+                LIMIT %s
+                """,
+                (f"%{query}%",),
+                limit,
+            )
     return ok({"count": len(rows), "locations": rows})
 
 # -------------------------
 # EVENT
 # -------------------------
 
-@mcp.tool()
+@tool()
 def create_event(event_type: str):
     if not event_type:
         return err("missing_type")
     eid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute("INSERT INTO event (id, type) VALUES (%s,%s)", (eid, event_type))
     return ok({"event_id": eid})
 
-@mcp.tool()
+@tool()
 def link_person_event(person_id: str, event_id: str, role: str = "subject"):
-    with db_conn() as conn, conn.cursor() as cur:
+    if not _is_uuid(person_id) or not _is_uuid(event_id):
+        return err("bad_uuid", {"person_id": person_id, "event_id": event_id})
+    with simple_write() as cur:
         cur.execute(
             """
             INSERT INTO person_event (person_id, event_id, role)
@@ -180,11 +600,44 @@ def link_person_event(person_id: str, event_id: str, role: str = "subject"):
         )
     return ok({"person_id": person_id, "event_id": event_id, "role": role})
 
-@mcp.tool()
-def get_events_for_person(person_id: str, limit: int = 100):
-    limit = max(1, min(int(limit), 500))
+@tool()
+def bulk_link_person_events(links_csv: str):
+    """
+    Link many persons to events in one call.
+    `links_csv` is "person_id,event_id,role;person_id,event_id,role;...";
+    role may be omitted (defaults to "subject"). Existing links get the new
+    role; if a pair repeats, its last role wins.
+    """
+    try:
+        links = _parse_links_csv(links_csv)
+    except ValueError as e:
+        return err("bad_link", {"value": e.args[0]})
+    if not links:
+        return err("no_links")
+    buf = io.StringIO()
+    csv.writer(buf).writerows(links)
+    buf.seek(0)
     with db_conn() as conn, conn.cursor() as cur:
+        cur.execute("CREATE TEMP TABLE _tmp_link (pid uuid, eid uuid, role text) ON COMMIT DROP")
+        cur.copy_expert("COPY _tmp_link (pid, eid, role) FROM STDIN WITH (FORMAT csv)", buf)
         cur.execute(
+            """
+            INSERT INTO person_event (person_id, event_id, role)
+            SELECT pid, eid, role FROM _tmp_link
+            ON CONFLICT (person_id, event_id) DO UPDATE SET role=EXCLUDED.role
+            """
+        )
+    return ok({"count": len(links)})
+
+@tool()
+def get_events_for_person(person_id: str, limit: int = 100):
+    limit = max(1, min(int(limit), 500))
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            None,  # e.* follows the event table's columns; not prepared
             """
             SELECT e.*, pe.role
             FROM person_event pe
@@ -193,358 +646,388 @@ def get_events_for_person(person_id: str, limit: int = 100):
             ORDER BY e.type
             LIMIT %s
             """,
-            (person_id, limit),
+            (person_id,),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "events": rows})
 
 # -------------------------
 # RELATIONSHIP
 # -------------------------
 
-@mcp.tool()
+@tool()
 def create_relationship(person_id_a: str, person_id_b: str, relation_type: str):
     if not relation_type:
         return err("missing_type")
+    if not _is_uuid(person_id_a) or not _is_uuid(person_id_b):
+        return err("bad_uuid", {"person_id_a": person_id_a, "person_id_b": person_id_b})
     rid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute(
             "INSERT INTO relationship (id, person_id_a, person_id_b, type) VALUES (%s,%s,%s,%s)",
             (rid, person_id_a, person_id_b, relation_type),
         )
     return ok({"relationship_id": rid})
 
-@mcp.tool()
+@tool()
 def list_relationships(person_id: str, limit: int = 200):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_relationships",
             """
-            SELECT *
+            SELECT id, person_id_a, person_id_b, type
             FROM relationship
             WHERE person_id_a = %s OR person_id_b = %s
             ORDER BY type
             LIMIT %s
             """,
-            (person_id, person_id, limit),
+            (person_id, person_id),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "relationships": rows})
 
-@mcp.tool()
+# Lowercased relationship.type values get_family_group buckets on.
+_PARENT_TYPES = frozenset({"parent", "father", "mother"})
+_CHILD_TYPES = frozenset({"child", "son", "daughter"})
+_SPOUSE_TYPES = frozenset({"spouse", "partner"})
+
+def _sql_in_list(values: frozenset) -> str:
+    return ",".join(f"'{v}'" for v in sorted(values))
+
+# Built once at import: relationships are classified and de-duplicated in SQL,
+# then the person and each family bucket come back as JSON in one round-trip.
+_FAMILY_GROUP_SQL = f"""
+    WITH r AS (
+        SELECT
+            CASE
+                WHEN lower(type) IN ({_sql_in_list(_SPOUSE_TYPES)}) THEN 'spouse'
+                WHEN lower(type) IN ({_sql_in_list(_PARENT_TYPES)})
+                    THEN CASE WHEN person_id_b=%(pid)s THEN 'parent' ELSE 'child' END
+                WHEN lower(type) IN ({_sql_in_list(_CHILD_TYPES)})
+                    THEN CASE WHEN person_id_a=%(pid)s THEN 'parent' ELSE 'child' END
+            END AS bucket,
+            CASE WHEN person_id_a=%(pid)s THEN person_id_b ELSE person_id_a END AS other_id
+        FROM relationship
+        WHERE person_id_a=%(pid)s OR person_id_b=%(pid)s
+    ), b AS (
+        SELECT
+            array_agg(DISTINCT other_id) FILTER (WHERE bucket='parent') AS parents,
+            array_agg(DISTINCT other_id) FILTER (WHERE bucket='child') AS children,
+            array_agg(DISTINCT other_id) FILTER (WHERE bucket='spouse') AS spouses
+        FROM r
+    )
+    SELECT
+        (SELECT row_to_json(me) FROM person me WHERE me.id=%(pid)s) AS person,
+        (SELECT coalesce(json_agg(p ORDER BY p.id), '[]') FROM person p, b WHERE p.id = ANY(b.parents)) AS parents,
+        (SELECT coalesce(json_agg(p ORDER BY p.id), '[]') FROM person p, b WHERE p.id = ANY(b.children)) AS children,
+        (SELECT coalesce(json_agg(p ORDER BY p.id), '[]') FROM person p, b WHERE p.id = ANY(b.spouses)) AS spouses
+"""
+
+@tool()
 def get_family_group(person_id: str):
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute("SELECT * FROM person WHERE id=%s", (person_id,))
-        person = cur.fetchone()
-        if not person:
-            return err("not_found")
-
-        cur.execute(
-            "SELECT * FROM relationship WHERE person_id_a=%s OR person_id_b=%s",
-            (person_id, person_id),
-        )
-        rels = cur.fetchall()
-
-        parents: List[str] = []
-        children: List[str] = []
-        spouses: List[str] = []
-
-        parent_types = {"parent", "father", "mother"}
-        child_types = {"child", "son", "daughter"}
-        spouse_types = {"spouse", "partner"}
-
-        for r in rels:
-            t = (r.get("type") or "").lower()
-            a = r.get("person_id_a")
-            b = r.get("person_id_b")
-
-            if t in spouse_types:
-                other = b if a == person_id else a
-                if other:
-                    spouses.append(other)
-                continue
-
-            if t in parent_types:
-                if b == person_id and a:
-                    parents.append(a)
-                elif a == person_id and b:
-                    children.append(b)
-                continue
-
-            if t in child_types:
-                if a == person_id and b:
-                    parents.append(b)
-                elif b == person_id and a:
-                    children.append(a)
-                continue
-
-        parents = sorted(set(parents))
-        children = sorted(set(children))
-        spouses = sorted(set(spouses))
-
-        def _fetch_people(ids: List[str]) -> List[Dict[str, Any]]:
-            if not ids:
-                return []
-            cur.execute("SELECT * FROM person WHERE id = ANY(%s::uuid[])", (ids,))
-            return cur.fetchall()
+        cur.execute(_FAMILY_GROUP_SQL, {"pid": person_id})
+        row = cur.fetchone()
 
-        return ok({
-            "person": person,
-            "parents": _fetch_people(parents),
-            "children": _fetch_people(children),
-            "spouses": _fetch_people(spouses),
-        })
+    if not row["person"]:
+        return err("not_found")
+    return ok(row)
 
 # -------------------------
 # ASSERTION / EVIDENCE
 # -------------------------
 
-@mcp.tool()
+@tool()
 def add_assertion(subject_table: str, subject_id: str, field_name: str, asserted_value: str):
     if not subject_table or not subject_id or not field_name:
         return err("missing_fields")
     aid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute(
             "INSERT INTO assertion (id, subject_table, subject_id, field_name, asserted_value) VALUES (%s,%s,%s,%s,%s)",
             (aid, subject_table, subject_id, field_name, asserted_value),
         )
     return ok({"assertion_id": aid})
 
-@mcp.tool()
+@tool()
 def list_assertions(subject_table: str, subject_id: str, limit: int = 200):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_assertions",
             """
-            SELECT *
+            SELECT id, subject_table, subject_id, field_name, asserted_value
             FROM assertion
             WHERE subject_table=%s AND subject_id=%s
             ORDER BY id
             LIMIT %s
             """,
-            (subject_table, subject_id, limit),
+            (subject_table, subject_id),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "assertions": rows})
 
-@mcp.tool()
+@tool()
 def link_source_to_person(person_id: str, source_ref: str):
     # Store a source reference as a normal assertion (no new tables needed)
     return add_assertion("person", person_id, "source_link", source_ref)
 
-@mcp.tool()
+@tool()
 def list_sources_for_person(person_id: str, limit: int = 200):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_sources_for_person",
             """
             SELECT asserted_value AS source_ref
             FROM assertion
             WHERE subject_table='person' AND subject_id=%s AND field_name='source_link'
             LIMIT %s
             """,
-            (person_id, limit),
+            (person_id,),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "sources": rows})
 
 # =========================================================
 # V2 SAFE ADDITIONS (NO GENERIC ENTITY/TABLE ARGUMENTS)
 # =========================================================
 
+def _status_update_sql(table: str) -> str:
+    # One statement per table for both verify and reject, so both tools share
+    # a single prepared statement. A row already in the requested state (with
+    # the same or no new notes) is not rewritten; `target` still returns it,
+    # which tells "unchanged" apart from "not found" without a second query.
+    return f"""
+        WITH target AS (
+            SELECT id, status FROM {table} WHERE id=%s
+        ), upd AS (
+            UPDATE {table} t
+            SET status=%s,
+                status_notes = COALESCE(NULLIF(%s,''), t.status_notes)
+            FROM target
+            WHERE t.id = target.id
+              AND (t.status IS DISTINCT FROM %s
+                   OR (%s <> '' AND t.status_notes IS DISTINCT FROM %s))
+            RETURNING t.id
+        )
+        SELECT target.id, upd.id IS NOT NULL AS changed
+        FROM target LEFT JOIN upd ON upd.id = target.id
+    """
+
+# Fixed tables only; never built from tool arguments.
+_STATUS_SQL: Dict[str, str] = {
+    table: _status_update_sql(table) for table in ("person", "relationship", "assertion")
+}
+
+def _set_status(cur: Any, table: str, row_id: str, status: str, notes: str) -> Optional[bool]:
+    """
+    Set status (and optionally status_notes) on one row.
+    Returns whether the row changed (False: already in that state),
+    or None if the row does not exist.
+    """
+    exec_prepared(
+        cur,
+        f"ps_set_{table}_status",
+        _STATUS_SQL[table],
+        (row_id, status, notes, status, notes, notes),
+    )
+    row = cur.fetchone()
+    return row["changed"] if row else None
+
 # -------------------------
 # STATUS / REVIEW (PERSON)
 # -------------------------
 
-@mcp.tool()
+@tool()
 def mark_person_verified(person_id: str, notes: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE person
-            SET status='verified',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (notes, person_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"person_id": person_id, "status": "verified"})
-
-@mcp.tool()
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "person", person_id, "verified", notes)
+    if changed is None:
+        return err("not_found")
+    return ok({"person_id": person_id, "status": "verified", "changed": changed})
+
+@tool()
 def mark_person_rejected(person_id: str, reason: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE person
-            SET status='rejected',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (reason, person_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"person_id": person_id, "status": "rejected"})
-
-@mcp.tool()
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "person", person_id, "rejected", reason)
+    if changed is None:
+        return err("not_found")
+    return ok({"person_id": person_id, "status": "rejected", "changed": changed})
+
+@tool()
 def list_unreviewed_persons(limit: int = 50):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_unreviewed_persons",
             """
-            SELECT *
+            SELECT id, first_name, middle_name, last_name, status
             FROM person
             WHERE status IS NULL OR status='unreviewed'
             LIMIT %s
             """,
-            (limit,),
+            (),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "persons": rows})
 
-@mcp.tool()
+@tool()
 def bulk_mark_persons_verified(person_ids_csv: str):
-    ids = _parse_uuid_csv(person_ids_csv)
+    try:
+        ids = _parse_uuid_csv(person_ids_csv)
+    except ValueError as e:
+        return err("bad_uuid", {"value": e.args[0]})
     if not ids:
         return err("no_ids")
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute("UPDATE person SET status='verified' WHERE id = ANY(%s::uuid[])", (ids,))
-    return ok({"count": len(ids), "status": "verified"})
+        updated = execute_values(
+            cur,
+            "UPDATE person SET status='verified' FROM (VALUES %s) AS v(id) WHERE person.id = v.id RETURNING person.id",
+            [(i,) for i in ids],
+            page_size=BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    return ok({"count": len(ids), "updated": len(updated), "status": "verified"})
 
-@mcp.tool()
+@tool()
 def bulk_mark_persons_rejected(person_ids_csv: str, reason: str = ""):
-    ids = _parse_uuid_csv(person_ids_csv)
+    try:
+        ids = _parse_uuid_csv(person_ids_csv)
+    except ValueError as e:
+        return err("bad_uuid", {"value": e.args[0]})
     if not ids:
         return err("no_ids")
     with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+        # execute_values allows a single placeholder, so the reason rides along
+        # as a constant column of every VALUES row.
+        updated = execute_values(
+            cur,
             """
             UPDATE person
             SET status='rejected',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id = ANY(%s::uuid[])
+                status_notes = COALESCE(NULLIF(v.reason,''), person.status_notes)
+            FROM (VALUES %s) AS v(id, reason)
+            WHERE person.id = v.id
+            RETURNING person.id
             """,
-            (reason, ids),
+            [(i, reason) for i in ids],
+            page_size=BULK_PAGE_SIZE,
+            fetch=True,
         )
-    return ok({"count": len(ids), "status": "rejected"})
+    return ok({"count": len(ids), "updated": len(updated), "status": "rejected"})
 
 # -------------------------
 # STATUS / REVIEW (RELATIONSHIP)
 # -------------------------
 
-@mcp.tool()
+@tool()
 def mark_relationship_verified(relationship_id: str, notes: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE relationship
-            SET status='verified',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (notes, relationship_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"relationship_id": relationship_id, "status": "verified"})
-
-@mcp.tool()
+    if not _is_uuid(relationship_id):
+        return err("bad_uuid", {"relationship_id": relationship_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "relationship", relationship_id, "verified", notes)
+    if changed is None:
+        return err("not_found")
+    return ok({"relationship_id": relationship_id, "status": "verified", "changed": changed})
+
+@tool()
 def mark_relationship_rejected(relationship_id: str, reason: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE relationship
-            SET status='rejected',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (reason, relationship_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"relationship_id": relationship_id, "status": "rejected"})
-
-@mcp.tool()
+    if not _is_uuid(relationship_id):
+        return err("bad_uuid", {"relationship_id": relationship_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "relationship", relationship_id, "rejected", reason)
+    if changed is None:
+        return err("not_found")
+    return ok({"relationship_id": relationship_id, "status": "rejected", "changed": changed})
+
+@tool()
 def list_unreviewed_relationships(limit: int = 50):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_unreviewed_relationships",
             """
-            SELECT *
+            SELECT id, person_id_a, person_id_b, type, status
             FROM relationship
             WHERE status IS NULL OR status='unreviewed'
             LIMIT %s
             """,
-            (limit,),
+            (),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "relationships": rows})
 
 # -------------------------
 # STATUS / REVIEW (ASSERTION)
 # -------------------------
 
-@mcp.tool()
+@tool()
 def mark_assertion_verified(assertion_id: str, notes: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE assertion
-            SET status='verified',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (notes, assertion_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"assertion_id": assertion_id, "status": "verified"})
-
-@mcp.tool()
+    if not _is_uuid(assertion_id):
+        return err("bad_uuid", {"assertion_id": assertion_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "assertion", assertion_id, "verified", notes)
+    if changed is None:
+        return err("not_found")
+    return ok({"assertion_id": assertion_id, "status": "verified", "changed": changed})
+
+@tool()
 def mark_assertion_rejected(assertion_id: str, reason: str = ""):
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            UPDATE assertion
-            SET status='rejected',
-                status_notes = COALESCE(NULLIF(%s,''), status_notes)
-            WHERE id=%s
-            """,
-            (reason, assertion_id),
-        )
-        if cur.rowcount == 0:
-            return err("not_found")
-    return ok({"assertion_id": assertion_id, "status": "rejected"})
-
-@mcp.tool()
+    if not _is_uuid(assertion_id):
+        return err("bad_uuid", {"assertion_id": assertion_id})
+    with simple_write() as cur:
+        changed = _set_status(cur, "assertion", assertion_id, "rejected", reason)
+    if changed is None:
+        return err("not_found")
+    return ok({"assertion_id": assertion_id, "status": "rejected", "changed": changed})
+
+@tool()
 def list_unreviewed_assertions(limit: int = 50):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_unreviewed_assertions",
             """
-            SELECT *
+            SELECT id, subject_table, subject_id, field_name, asserted_value, status
             FROM assertion
             WHERE status IS NULL OR status='unreviewed'
             LIMIT %s
             """,
-            (limit,),
+            (),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "assertions": rows})
 
 # -------------------------
 # RESEARCH NOTES (OPTIONAL TABLE)
 # -------------------------
 
-@mcp.tool()
+@tool()
 def save_research_note(person_id: str, note: str, source_url: str = ""):
     if not note:
         return err("missing_note")
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
     nid = _uuid()
-    with db_conn() as conn, conn.cursor() as cur:
+    with simple_write() as cur:
         cur.execute(
             """
             INSERT INTO research_note (id, person_id, note, source_url)
@@ -554,39 +1037,67 @@ def save_research_note(person_id: str, note: str, source_url: str = ""):
         )
     return ok({"note_id": nid})
 
-@mcp.tool()
+@tool()
 def list_research_notes(person_id: str, limit: int = 100):
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
+    if not _is_uuid(person_id):
+        return err("bad_uuid", {"person_id": person_id})
+    with db_conn() as conn:
+        rows = fetch_rows(
+            conn,
+            "ps_list_research_notes",
             """
-            SELECT *
+            SELECT id, person_id, note, source_url, created_at
             FROM research_note
             WHERE person_id=%s
             ORDER BY created_at DESC
             LIMIT %s
             """,
-            (person_id, limit),
+            (person_id,),
+            limit,
         )
-        rows = cur.fetchall()
     return ok({"count": len(rows), "notes": rows})
 
-@mcp.tool()
+@tool()
 def search_research_notes(query: str, limit: int = 100):
-    like = f"%{query}%"
+    """
+    Full-text search over research notes (English stemming; all words must match).
+    If `query` contains * or % it is instead matched case-insensitively anywhere
+    in the note, with * as the wildcard (e.g. "van *berg" finds "... van Hoberg ...").
+    An empty query returns the most recent notes.
+    """
     limit = max(1, min(int(limit), 500))
-    with db_conn() as conn, conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT *
-            FROM research_note
-            WHERE note ILIKE %s
-            ORDER BY created_at DESC
-            LIMIT %s
-            """,
-            (like, limit),
-        )
-        rows = cur.fetchall()
+    with db_conn() as conn:
+        # plainto_tsquery('') matches nothing, so blank queries take the
+        # pattern path ('%%' matches every note, as before full-text search).
+        if not query.strip() or "*" in query or "%" in query:
+            rows = fetch_rows(
+                conn,
+                "ps_search_research_notes_like",
+                """
+                SELECT id, person_id, note, source_url, created_at
+                FROM research_note
+                WHERE note ILIKE %s
+                ORDER BY created_at DESC
+                LIMIT %s
+                """,
+                (f"%{query.replace('*', '%')}%",),
+                limit,
+            )
+        else:
+            rows = fetch_rows(
+                conn,
+                "ps_search_research_notes",
+                """
+                SELECT id, person_id, note, source_url, created_at
+                FROM research_note
+                WHERE to_tsvector('english', note) @@ plainto_tsquery('english', %s)
+                ORDER BY created_at DESC
+                LIMIT %s
+                """,
+                (query,),
+                limit,
+            )
     return ok({"count": len(rows), "notes": rows})
 
 # -------------------------